@@ -1,14 +1,23 @@
 import datetime as dt
 
 import typer
-from rich.console import Console
-from rich.table import Table
 
 import timeteller as tt
 
-console = Console()
 app = typer.Typer(add_completion=False)
 
+# The CLI is English-only (matching the hardcoded row labels), so weekday names
+# come from a plain tuple lookup instead of locale-aware strftime("%A").
+_WEEKDAYS = (
+    "Monday",
+    "Tuesday",
+    "Wednesday",
+    "Thursday",
+    "Friday",
+    "Saturday",
+    "Sunday",
+)
+
 
 START_ARG = typer.Argument(
     ...,
@@ -50,6 +59,11 @@ def duration(start: dt.datetime = START_ARG, end: dt.datetime | None = END_ARG)
     Example:
     $ timeteller duration 1991-02-20
     """
+    # rich is only needed once a table actually renders; keep it off the
+    # import-time path so --version and --help stay cheap
+    from rich.console import Console
+    from rich.table import Table
+
     start_dt = tt.ext.parse(start)
     start_iso = tt.stdlib.isoformat(start_dt)
     is_date_fmt = len(start_iso) == len("YYYY-MM-DD")
@@ -60,25 +74,30 @@ def duration(start: dt.datetime = START_ARG, end: dt.datetime | None = END_ARG)
 
     d = tt.ext.Duration(start_dt, end_dt)
 
+    if end is None:
+        end_comment = "today" if is_date_fmt else "now"
+    else:
+        end_comment = _WEEKDAYS[d.end_dt.weekday()]
+
+    num_days = (d.end_dt.date() - d.start_dt.date()).days + 1
+    num_days_text = "1 day" if num_days == 1 else f"{num_days:_} days"
+
+    rows = [
+        ("start", tt.stdlib.isoformat(d.start_dt), _WEEKDAYS[d.start_dt.weekday()]),
+        ("end", tt.stdlib.isoformat(d.end_dt), end_comment),
+        ("duration", str(d), "elapsed time"),
+        ("day count", num_days_text, "start/end incl."),
+    ]
+
     gray = "#666666"
     table = Table(header_style=gray, style=gray)
     table.add_column("", justify="left", style="#FFB270", no_wrap=True)
     table.add_column("value", justify="right", style="#FFEC71", no_wrap=True)
     table.add_column("comment", justify="right", style=gray, no_wrap=True)
+    for row in rows:
+        table.add_row(*row)
 
-    table.add_row("start", tt.stdlib.isoformat(d.start_dt), d.start_dt.strftime("%A"))
-    if end is None:
-        comment = "today" if is_date_fmt else "now"
-    else:
-        comment = d.end_dt.strftime("%A")
-    table.add_row("end", tt.stdlib.isoformat(d.end_dt), comment)
-    table.add_row("duration", str(d), "elapsed time")
-
-    num_days = tt.ext.datesub("days", d.start_dt, d.end_dt) + 1
-    num_days_text = "1 day" if num_days == 1 else f"{num_days:_} days"
-    table.add_row("day count", num_days_text, "start/end incl.")
-
-    console.print(table)
+    Console().print(table)
 
 
 @app.command()
@@ -92,6 +111,9 @@ def datesub(
     Example:
     $ timeteller datesub --unit decades 1991-02-20
     """
+    from rich.console import Console
+    from rich.table import Table
+
     start_dt = tt.ext.parse(start)
     start_iso = tt.stdlib.isoformat(start_dt)
     is_date_fmt = len(start_iso) == len("YYYY-MM-DD")
@@ -108,15 +130,16 @@ def datesub(
     table.add_column("value", justify="right", style="#FFEC71", no_wrap=True)
     table.add_column("comment", justify="right", style=gray, no_wrap=True)
 
-    table.add_row("start", tt.stdlib.isoformat(start_dt), start_dt.strftime("%A"))
+    start_day = _WEEKDAYS[start_dt.weekday()]
+    table.add_row("start", tt.stdlib.isoformat(start_dt), start_day)
     if end is None:
         comment = "today" if is_date_fmt else "now"
     else:
-        comment = end_dt.strftime("%A")
+        comment = _WEEKDAYS[end_dt.weekday()]
     table.add_row("end", tt.stdlib.isoformat(end_dt), comment)
     table.add_row("datesub", f"{result:_}", unit)
 
-    console.print(table)
+    Console().print(table)
 
 
 @app.command()
@@ -133,6 +156,9 @@ def offset(
     $ timeteller offset today add 3 days
     $ timeteller offset now sub 2 hours
     """
+    from rich.console import Console
+    from rich.table import Table
+
     token = str(reference).strip().lower()
 
     if token == "today":
@@ -155,15 +181,17 @@ def offset(
     table.add_column("value", justify="right", style="#FFEC71", no_wrap=True)
     table.add_column("comment", justify="right", style=gray, no_wrap=True)
 
-    table.add_row("reference", tt.stdlib.isoformat(ref_dt), ref_dt.strftime("%A"))
-    table.add_row("offset", tt.stdlib.isoformat(offset_dt), offset_dt.strftime("%A"))
+    ref_day = _WEEKDAYS[ref_dt.weekday()]
+    offset_day = _WEEKDAYS[offset_dt.weekday()]
+    table.add_row("reference", tt.stdlib.isoformat(ref_dt), ref_day)
+    table.add_row("offset", tt.stdlib.isoformat(offset_dt), offset_day)
 
     d = tt.ext.Duration(ref_dt, offset_dt)
-    num_days = tt.ext.datesub("days", d.start_dt, d.end_dt) + 1
+    num_days = (d.end_dt.date() - d.start_dt.date()).days + 1
     num_days_text = "1 day" if num_days == 1 else f"{num_days:_} days"
     table.add_row("day count", num_days_text, "ref/off incl.")
 
-    console.print(table)
+    Console().print(table)
 
 
 def main() -> None:
@@ -1,20 +1,139 @@
 __all__ = ("Duration", "Stopwatch", "datesub", "parse", "offset")
 
 import datetime as dt
+import functools
 import logging
+import re
 from collections.abc import Callable, Sequence
 from contextlib import ContextDecorator
 from dataclasses import dataclass, field
+from typing import Final
 
 import duckdb
 from dateutil import parser
-from dateutil.relativedelta import relativedelta
 
 import timeteller as tt
 
 logger = logging.getLogger(__name__)
 
 
+_MONTH_DAYS = (31, 28, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31)
+
+# English month names and their three-letter abbreviations, matching
+# dateutil.parser's default (English-only) vocabulary.
+_MONTH_NAMES = (
+    "january",
+    "february",
+    "march",
+    "april",
+    "may",
+    "june",
+    "july",
+    "august",
+    "september",
+    "october",
+    "november",
+    "december",
+)
+_MONTH_NUMBERS = {
+    key: index
+    for index, name in enumerate(_MONTH_NAMES, start=1)
+    for key in (name, name[:3])
+}
+
+# "March 3rd, 2020 5:30 PM" / "Mar 3 2020 05:30 PM" / "March 3, 2020" / "March 3"
+_NATURAL_MDY_RE = re.compile(
+    r"^([A-Za-z]+)\s+(\d{1,2})(?:st|nd|rd|th)?"
+    r"(?:,?\s+(\d{4}))?"
+    r"(?:\s+(\d{1,2}):(\d{2})(?::(\d{2}))?(?:\s*([AaPp])\.?[Mm]\.?)?)?$"
+)
+
+# "3 March 2020 17:30:45"
+_NATURAL_DMY_RE = re.compile(
+    r"^(\d{1,2})\s+([A-Za-z]+)\s+(\d{4})"
+    r"(?:\s+(\d{1,2}):(\d{2})(?::(\d{2}))?(?:\s*([AaPp])\.?[Mm]\.?)?)?$"
+)
+
+
+def _parse_natural(value: str) -> dt.datetime | None:
+    """Return a datetime for common English date phrases, or None on no match."""
+    value = value.strip()
+
+    match = _NATURAL_MDY_RE.match(value)
+    if match is not None:
+        month_name, day, year, hour, minute, second, meridiem = match.groups()
+    else:
+        match = _NATURAL_DMY_RE.match(value)
+        if match is None:
+            return None
+        day, month_name, year, hour, minute, second, meridiem = match.groups()
+
+    month = _MONTH_NUMBERS.get(month_name.lower())
+    if month is None:
+        return None
+
+    hour_value = int(hour) if hour else 0
+    if meridiem is not None:
+        if meridiem in "Pp" and hour_value != 12:
+            hour_value += 12
+        elif meridiem in "Aa" and hour_value == 12:
+            hour_value = 0
+
+    try:
+        return dt.datetime(
+            int(year) if year else 1900,
+            month,
+            int(day),
+            hour_value,
+            int(minute or 0),
+            int(second or 0),
+        )
+    except ValueError:
+        # out-of-range component - let the generic parser have a go
+        return None
+
+
+def _days_in_month(year: int, month: int) -> int:
+    """Return the number of days in a month using plain int arithmetic."""
+    if month == 2 and year % 4 == 0 and (year % 100 != 0 or year % 400 == 0):
+        return 29
+    return _MONTH_DAYS[month - 1]
+
+
+def _shift_months(value: dt.datetime, months: int) -> dt.datetime:
+    """Return a datetime shifted by whole months, clamping the day if needed."""
+    month_index = value.month - 1 + months
+    year = value.year + month_index // 12
+    month = month_index % 12 + 1
+    day = min(value.day, _days_in_month(year, month))
+    return value.replace(year=year, month=month, day=day)
+
+
+def _relativedelta_fields(
+    start: dt.datetime,
+    end: dt.datetime,
+) -> tuple[int, int, int, int, int, int, int]:
+    """Return (years, months, days, hours, minutes, seconds, microseconds).
+
+    Component-wise Gregorian difference between two ordered datetimes using plain
+    int arithmetic; a cheap replacement for ``dateutil.relativedelta``.
+    """
+    if start.tzinfo is not None:
+        end = end.astimezone(start.tzinfo)
+
+    months = (end.year - start.year) * 12 + (end.month - start.month)
+    anchor = _shift_months(start, months)
+    if anchor > end:
+        months -= 1
+        anchor = _shift_months(start, months)
+
+    delta = end - anchor
+    years, months = divmod(months, 12)
+    minutes, seconds = divmod(delta.seconds, 60)
+    hours, minutes = divmod(minutes, 60)
+    return years, months, delta.days, hours, minutes, seconds, delta.microseconds
+
+
 @dataclass(frozen=True, slots=True)
 class Duration:
     """Non-negative length of time that elapsed between two dates or times.
@@ -43,58 +162,113 @@ class Duration:
 
     start_dt: dt.datetime
     end_dt: dt.datetime
-    delta: relativedelta = field(repr=False)
+    _years: int = field(init=False, repr=False, compare=False)
+    _months: int = field(init=False, repr=False, compare=False)
+    _days: int = field(init=False, repr=False, compare=False)
+    _hours: int = field(init=False, repr=False, compare=False)
+    _minutes: int = field(init=False, repr=False, compare=False)
+    _seconds: int = field(init=False, repr=False, compare=False)
+    _microseconds: int = field(init=False, repr=False, compare=False)
+    _weeks: int = field(init=False, repr=False, compare=False)
+    _days_after_weeks: int = field(init=False, repr=False, compare=False)
+    _total_us: int = field(init=False, repr=False, compare=False)
+    _is_zero: bool = field(init=False, repr=False, compare=False)
+    _formatted_seconds: str = field(init=False, repr=False, compare=False)
+    _repr: str = field(init=False, repr=False, compare=False)
 
     def __init__(self, start: tt.stdlib.DateTimeLike, end: tt.stdlib.DateTimeLike):
-        start_dt = parse(start)
-        end_dt = parse(end)
+        # type() instead of isinstance() so dt.date subclasses still go via parse
+        if type(start) is dt.datetime and type(end) is dt.datetime:
+            start_dt, end_dt = start, end
+        else:
+            start_dt = _parse_cached(start) if isinstance(start, str) else parse(start)
+            end_dt = _parse_cached(end) if isinstance(end, str) else parse(end)
+
+        _set = object.__setattr__
 
         if end_dt < start_dt:
             start_dt, end_dt = end_dt, start_dt
 
-        object.__setattr__(self, "start_dt", start_dt)
-        object.__setattr__(self, "end_dt", end_dt)
-        object.__setattr__(self, "delta", relativedelta(end_dt, start_dt))
+        _set(self, "start_dt", start_dt)
+        _set(self, "end_dt", end_dt)
+
+        td = end_dt - start_dt
+        total_us = (td.days * 86_400 + td.seconds) * 1_000_000 + td.microseconds
+        _set(self, "_total_us", total_us)
+
+        fields = _relativedelta_fields(start_dt, end_dt)
+        years, months, days, hours, minutes, seconds, microseconds = fields
+        _set(self, "_years", years)
+        _set(self, "_months", months)
+        _set(self, "_days", days)
+        _set(self, "_hours", hours)
+        _set(self, "_minutes", minutes)
+        _set(self, "_seconds", seconds)
+        _set(self, "_microseconds", microseconds)
+
+        weeks, days_after_weeks = divmod(days, 7)
+        _set(self, "_weeks", weeks)
+        _set(self, "_days_after_weeks", days_after_weeks)
+
+        _set(self, "_is_zero", not any(fields))
+
+        if microseconds:
+            # strip trailing zeros arithmetically instead of via rstrip
+            fraction, digits = microseconds, 6
+            while fraction % 10 == 0:
+                fraction //= 10
+                digits -= 1
+            formatted = f"{seconds}.{fraction:0{digits}d}"
+        elif seconds:
+            formatted = str(seconds)
+        else:
+            formatted = "0"
+        _set(self, "_formatted_seconds", formatted)
+
+        start_iso = tt.stdlib.isoformat(start_dt)
+        end_iso = tt.stdlib.isoformat(end_dt)
+        class_name = type(self).__name__
+        _set(self, "_repr", f"{class_name}({start_iso}, {end_iso})")
 
     @property
     def years(self) -> int:
         """Return the number of whole years between start and end datetime values."""
-        return self.delta.years
+        return self._years
 
     @property
     def months(self) -> int:
         """Return the number of whole months (excluding years)."""
-        return self.delta.months
+        return self._months
 
     @property
     def days(self) -> int:
         """Return the number of days (excluding months and years)."""
-        return self.delta.days
+        return self._days
 
     @property
     def hours(self) -> int:
         """Return the number of hours (excluding days)."""
-        return self.delta.hours
+        return self._hours
 
     @property
     def minutes(self) -> int:
         """Return the number of minutes (excluding hours)."""
-        return self.delta.minutes
+        return self._minutes
 
     @property
     def seconds(self) -> int:
         """Return the remaining whole seconds (excluding minutes)."""
-        return self.delta.seconds
+        return self._seconds
 
     @property
     def microseconds(self) -> int:
         """Return the number of microseconds (excluding seconds)."""
-        return self.delta.microseconds
+        return self._microseconds
 
     @property
     def total_seconds(self) -> float:
         """Return the total duration in seconds."""
-        return (self.end_dt - self.start_dt).total_seconds()
+        return self._total_us / 1_000_000
 
     @property
     def is_zero(self) -> bool:
@@ -107,16 +281,7 @@ class Duration:
         >>> duration.is_zero
         True
         """
-        parts = (
-            self.years,
-            self.months,
-            self.days,
-            self.hours,
-            self.minutes,
-            self.seconds,
-            self.microseconds,
-        )
-        return all(v == 0 for v in parts)
+        return self._is_zero
 
     @property
     def formatted_seconds(self) -> str:
@@ -137,12 +302,7 @@ class Duration:
         >>> duration.seconds, duration.microseconds, duration.formatted_seconds
         (1, 234000, '1.234')
         """
-        if self.microseconds:
-            value = f"{self.seconds}.{self.microseconds:06d}".rstrip("0")
-            return value.rstrip(".")
-        if self.seconds:
-            return str(self.seconds)
-        return "0"
+        return self._formatted_seconds
 
     def as_default(self) -> str:
         """Return duration as a human-readable string.
@@ -158,18 +318,14 @@ class Duration:
         >>> duration.as_default()
         '1y 8d 1h 1m 1s'
         """
-        parts: list[str] = []
-
-        if self.years:
-            parts.append(f"{self.years}y")
-        if self.months:
-            parts.append(f"{self.months}mo")
-        if self.days:
-            parts.append(f"{self.days}d")
-        if self.hours:
-            parts.append(f"{self.hours}h")
-        if self.minutes:
-            parts.append(f"{self.minutes}m")
+        units = (
+            ("y", self._years),
+            ("mo", self._months),
+            ("d", self._days),
+            ("h", self._hours),
+            ("m", self._minutes),
+        )
+        parts = [f"{value}{suffix}" for suffix, value in units if value]
 
         seconds_part = self._get_seconds_part(len(parts))
         if seconds_part:
@@ -191,19 +347,13 @@ class Duration:
         >>> duration.as_compact_days()
         '373d 1h 1m 1s'
         """
-        total = int(round(self.total_seconds))
+        total = (self._total_us + 500_000) // 1_000_000
         minutes, _ = divmod(total, 60)
         hours, minutes = divmod(minutes, 60)
         days, hours = divmod(hours, 24)
 
-        parts: list[str] = []
-
-        if days:
-            parts.append(f"{days}d")
-        if hours:
-            parts.append(f"{hours}h")
-        if minutes:
-            parts.append(f"{minutes}m")
+        units = (("d", days), ("h", hours), ("m", minutes))
+        parts = [f"{value}{suffix}" for suffix, value in units if value]
 
         seconds_part = self._get_seconds_part(len(parts))
         if seconds_part:
@@ -225,22 +375,15 @@ class Duration:
         >>> duration.as_compact_weeks()
         '1y 1w 1d 1h 1m 1s'
         """
-        weeks, days = divmod(self.delta.days, 7)
-
-        parts: list[str] = []
-
-        if self.years:
-            parts.append(f"{self.years}y")
-        if self.months:
-            parts.append(f"{self.months}mo")
-        if weeks:
-            parts.append(f"{weeks}w")
-        if days:
-            parts.append(f"{days}d")
-        if self.hours:
-            parts.append(f"{self.hours}h")
-        if self.minutes:
-            parts.append(f"{self.minutes}m")
+        units = (
+            ("y", self._years),
+            ("mo", self._months),
+            ("w", self._weeks),
+            ("d", self._days_after_weeks),
+            ("h", self._hours),
+            ("m", self._minutes),
+        )
+        parts = [f"{value}{suffix}" for suffix, value in units if value]
 
         seconds_part = self._get_seconds_part(len(parts))
         if seconds_part:
@@ -262,34 +405,20 @@ class Duration:
         >>> duration.as_iso()
         'P1Y8DT1H1M1S'
         """
-        date_parts = []
-        time_parts = []
-
-        if self.years:
-            date_parts.append(f"{self.years}Y")
-        if self.months:
-            date_parts.append(f"{self.months}M")
-        if self.days:
-            date_parts.append(f"{self.days}D")
+        y = f"{self._years}Y" if self._years else ""
+        mo = f"{self._months}M" if self._months else ""
+        d = f"{self._days}D" if self._days else ""
+        h = f"{self._hours}H" if self._hours else ""
+        m = f"{self._minutes}M" if self._minutes else ""
 
-        if self.hours:
-            time_parts.append(f"{self.hours}H")
-        if self.minutes:
-            time_parts.append(f"{self.minutes}M")
+        num_time_parts = (h != "") + (m != "")
+        s = self._get_seconds_part(num_time_parts, unit="S")
+        if s == "0S" and (y or mo or d):
+            # zero seconds only renders when the whole duration is zero
+            s = ""
 
-        seconds_part = self._get_seconds_part(len(time_parts), unit="S")
-        if seconds_part != "0S":
-            time_parts.append(seconds_part)
-
-        if len(date_parts) == 0 and len(time_parts) == 0:
-            time_parts.append("0S")
-
-        result = ["P", *date_parts]
-        if time_parts:
-            result.append("T")
-            result.extend(time_parts)
-
-        return "".join(result)
+        time_part = f"T{h}{m}{s}" if (h or m or s) else ""
+        return f"P{y}{mo}{d}{time_part}"
 
     def as_total_seconds(self) -> str:
         """Return the total duration in seconds as a string.
@@ -322,9 +451,7 @@ class Duration:
         return f"0{unit}" if num_parts == 0 else ""
 
     def __repr__(self) -> str:
-        start = tt.stdlib.isoformat(self.start_dt)
-        end = tt.stdlib.isoformat(self.end_dt)
-        return f"{self.__class__.__name__}({start}, {end})"
+        return self._repr
 
     def __str__(self) -> str:
         return self.as_default()
@@ -478,14 +605,80 @@ def parse(
     formats: str | Sequence[str] | None = None,
 ) -> dt.datetime:
     """Return a datetime.datetime parsed from a datetime, date, time, or string."""
+    if isinstance(value, str) and formats is None:
+        return _parse_cached(value)
+
     try:
         return tt.stdlib.parse(value, formats)
     except ValueError:
+        result = _parse_natural(value)
+        if result is not None:
+            return result
         return parser.parse(value, default=dt.datetime(1900, 1, 1, 0, 0, 0, 0))
 
 
+@functools.lru_cache(maxsize=4096)
+def _parse_cached(value: str) -> dt.datetime:
+    """Return the parsed string, memoized across repeated values.
+
+    The natural-language fallbacks (regex plus dateutil heuristics) are the
+    expensive part of :func:`parse`; caching here covers them as well as the
+    stdlib fast path.
+    """
+    try:
+        return tt.stdlib.parse(value)
+    except ValueError:
+        result = _parse_natural(value)
+        if result is not None:
+            return result
+        return parser.parse(value, default=dt.datetime(1900, 1, 1, 0, 0, 0, 0))
+
+
+# Interval units accepted by offset(), mirroring DuckDB's INTERVAL spellings:
+# month-based units map to their length in months, the rest to timedelta kwargs.
+_OFFSET_MONTH_UNITS: Final[dict[str, int]] = {
+    alias: months
+    for name, months in (
+        ("month", 1),
+        ("quarter", 3),
+        ("year", 12),
+        ("decade", 120),
+        ("century", 1200),
+        ("millennium", 12000),
+    )
+    for alias in (name, f"{name}s")
+} | {"centuries": 1200, "millennia": 12000}
+
+_OFFSET_TIMEDELTA_UNITS: Final[dict[str, str]] = {
+    alias: kwarg
+    for kwarg in (
+        "weeks",
+        "days",
+        "hours",
+        "minutes",
+        "seconds",
+        "milliseconds",
+        "microseconds",
+    )
+    for alias in (kwarg, kwarg[:-1])
+}
+
+
 def offset(reference: tt.stdlib.DateTimeLike, value: int, unit: str) -> dt.datetime:
     """Return a datetime offset by a given number of time units from reference."""
-    query = f"SELECT ? + INTERVAL '{value}' {unit.strip().upper()}"
-    parameters = (parse(reference),)
-    return duckdb.execute(query, parameters).fetchone()[0]
+    # already-canonical units (the common case) skip the strip/lower copies
+    key = unit
+    if key not in _OFFSET_MONTH_UNITS and key not in _OFFSET_TIMEDELTA_UNITS:
+        key = unit.strip().lower()
+    ref_dt = parse(reference)
+
+    months = _OFFSET_MONTH_UNITS.get(key)
+    if months is not None:
+        return _shift_months(ref_dt, months * value)
+
+    kwarg = _OFFSET_TIMEDELTA_UNITS.get(key)
+    if kwarg is not None:
+        return ref_dt + dt.timedelta(**{kwarg: value})
+
+    message = f"Could not convert string {unit!r} to a valid interval unit"
+    raise duckdb.ConversionException(message)
@@ -10,10 +10,13 @@ __all__ = (
     "range",
 )
 
-import calendar
 import datetime as dt
+import functools
+import itertools
+import operator
+import re
 import zoneinfo
-from collections.abc import Iterator, Sequence
+from collections.abc import Callable, Iterator, Sequence
 from typing import Final, TypeAlias
 
 DateTimeLike: TypeAlias = str | dt.time | dt.date | dt.datetime
@@ -55,6 +58,135 @@ STRPTIME_FORMATS: Final[tuple[str, ...]] = (
     "%Y-%m-%dT%H:%M:%S%Z%z",
 )
 
+# Single-match fast path for the dominant ISO 8601 shapes, i.e.
+# "YYYY-MM-DD[ T]HH:MM[:SS[.ffffff]][Z|+HH:MM]" with every time part optional.
+_ISO_RE: Final[re.Pattern[str]] = re.compile(
+    r"^(\d{4})-(\d{2})-(\d{2})"
+    r"(?:[ T](\d{2}):(\d{2})(?::(\d{2})(?:\.(\d+))?)?"
+    r"(Z|[+-]\d{2}:\d{2})?)?$"
+)
+
+# %f accepts at most six fractional digits; longer fractions are truncated to
+# microsecond precision before the strptime sweep.
+_LONG_FRACTION_RE: Final[re.Pattern[str]] = re.compile(r"(\.\d{6})\d+")
+
+# Maps each input's "shape" (digits replaced by "d") straight to the strptime
+# format that matches it, so the common case skips the full format sweep. All
+# default formats except the %z/%Z variants are fixed-width, which makes the
+# shape a perfect key; insertion order mirrors STRPTIME_FORMATS precedence.
+_DIGIT_TRANS: Final[dict[int, str]] = str.maketrans("0123456789", "d" * 10)
+
+
+def _build_shape_dispatch() -> dict[str, str]:
+    sample = dt.datetime(2003, 1, 2, 4, 5, 6)
+    dispatch: dict[str, str] = {}
+    for fmt in STRPTIME_FORMATS:
+        if "%z" in fmt or "%Z" in fmt:
+            continue
+        shape = sample.strftime(fmt).translate(_DIGIT_TRANS)
+        dispatch.setdefault(shape, fmt)
+        if fmt.endswith("%S"):
+            for digits in range(1, 7):
+                dispatch.setdefault(f"{shape}.{'d' * digits}", f"{fmt}.%f")
+    return dispatch
+
+
+_SHAPE_DISPATCH: Final[dict[str, str]] = _build_shape_dispatch()
+
+
+def _build_formats_by_len() -> dict[int, tuple[str, ...]]:
+    """Group the fixed-width formats by rendered length, keeping tuple order.
+
+    Covers inputs whose shape-dispatched format fails on out-of-range values
+    (e.g. "07/25/2024" is shaped like %d/%m/%Y but only matches %m/%d/%Y);
+    the bucket narrows the retry to same-length candidates. Formats ending in
+    %S are also registered at the lengths their .%f variants produce.
+    """
+    sample = dt.datetime(2003, 1, 2, 4, 5, 6)
+    buckets: dict[int, list[str]] = {}
+    for fmt in STRPTIME_FORMATS:
+        if "%z" in fmt or "%Z" in fmt:
+            continue
+        length = len(sample.strftime(fmt))
+        buckets.setdefault(length, []).append(fmt)
+        if fmt.endswith("%S"):
+            for digits in range(1, 7):
+                extended = length + 1 + digits
+                buckets.setdefault(extended, []).append(f"{fmt}.%f")
+    return {length: tuple(formats) for length, formats in buckets.items()}
+
+
+_FORMATS_BY_LEN: Final[dict[int, tuple[str, ...]]] = _build_formats_by_len()
+
+
+# Month lengths for non-leap years; February is special-cased in last_day().
+_DAYS_IN_MONTH: Final[tuple[int, ...]] = (
+    31,
+    28,
+    31,
+    30,
+    31,
+    30,
+    31,
+    31,
+    30,
+    31,
+    30,
+    31,
+)
+
+# Unit names accepted by offset() and count(); exactly the timedelta kwargs.
+_TIMEDELTA_UNITS: Final[frozenset[str]] = frozenset(
+    {
+        "weeks",
+        "days",
+        "hours",
+        "minutes",
+        "seconds",
+        "microseconds",
+        "milliseconds",
+    }
+)
+
+# Per-unit timedelta constructors, positional where the signature allows it:
+# timedelta(days, seconds, microseconds, ...) skips keyword-argument handling.
+_UNIT_CTORS: Final[dict[str, Callable[[int], dt.timedelta]]] = {
+    "weeks": lambda v: dt.timedelta(0, 0, 0, 0, 0, 0, v),
+    "days": lambda v: dt.timedelta(v),
+    "hours": lambda v: dt.timedelta(0, 0, 0, 0, 0, v),
+    "minutes": lambda v: dt.timedelta(0, 0, 0, 0, v),
+    "seconds": lambda v: dt.timedelta(0, v),
+    "milliseconds": lambda v: dt.timedelta(0, 0, 0, v),
+    "microseconds": lambda v: dt.timedelta(0, 0, v),
+}
+
+
+def _from_iso_match(match: re.Match[str]) -> dt.datetime:
+    """Return a datetime built from an ``_ISO_RE`` match."""
+    year, month, day, hour, minute, second, fraction, offset = match.groups()
+
+    # truncate or right-pad the fraction to microsecond precision in one pass
+    microsecond = int((fraction + "000000")[:6]) if fraction else 0
+
+    tzinfo = None
+    if offset in ("Z", "+00:00", "-00:00"):
+        tzinfo = dt.UTC
+    elif offset is not None:
+        sign = 1 if offset[0] == "+" else -1
+        minutes = int(offset[1:3]) * 60 + int(offset[4:6])
+        tzinfo = dt.timezone(sign * dt.timedelta(minutes=minutes))
+
+    return dt.datetime(
+        int(year),
+        int(month),
+        int(day),
+        int(hour or 0),
+        int(minute or 0),
+        int(second or 0),
+        microsecond,
+        tzinfo,
+    )
+
 
 def parse(
     value: DateTimeLike,
@@ -73,22 +205,39 @@ def parse(
     if not isinstance(value, str):
         raise TypeError(f"unsupported type for value {type(value).__name__!r}")
 
+    if formats is not None and not isinstance(formats, str):
+        formats = tuple(formats)
+
+    return _parse_str(value, formats)
+
+
+@functools.lru_cache(maxsize=4096)
+def _parse_str(value: str, formats: str | tuple[str, ...] | None) -> dt.datetime:
+    """Return a datetime parsed from a string, caching results per input."""
     if isinstance(formats, str):
         try:
             return dt.datetime.strptime(value, formats)
         except ValueError as exc:
             raise ValueError(f"{value=!r} does not match format={formats!r}") from exc
 
-    if value.endswith("Z") and len(value) > 1:
-        value = value[:-1] + "+00:00"
+    match = _ISO_RE.match(value)
+    if match is not None:
+        try:
+            return _from_iso_match(match)
+        except ValueError:
+            # out-of-range component - try next strategy
+            pass
 
     try:
+        # Python 3.11+ fromisoformat accepts the trailing "Z" suffix natively
         return dt.datetime.fromisoformat(value)
     except ValueError:
         # error is expected - try next strategy
         pass
 
-    patterns = tuple(formats) if formats is not None else STRPTIME_FORMATS
+    value = _LONG_FRACTION_RE.sub(r"\1", value, count=1)
+
+    patterns = formats if formats is not None else STRPTIME_FORMATS
 
     def parse_string(val: str, ptrn: str) -> dt.datetime | None:
         try:
@@ -96,19 +245,41 @@ def parse(
         except ValueError:
             return None
 
-    for pattern in patterns:
-        result = parse_string(value, pattern)
-        if result is None and pattern.endswith("%S"):
-            microsecond_pattern = f"{pattern}.%f"
-            result = parse_string(value, microsecond_pattern)
-        if result is None:
-            # error is expected - try next pattern
-            continue
+    def try_pattern(val: str, ptrn: str) -> dt.datetime | None:
+        result = parse_string(val, ptrn)
+        if result is None and ptrn.endswith("%S"):
+            microsecond_pattern = f"{ptrn}.%f"
+            result = parse_string(val, microsecond_pattern)
         return result
 
+    if formats is None:
+        hinted = _SHAPE_DISPATCH.get(value.translate(_DIGIT_TRANS))
+        if hinted is not None:
+            result = parse_string(value, hinted)
+            if result is not None:
+                return result
+
+        for pattern in _FORMATS_BY_LEN.get(len(value), ()):
+            if pattern is not hinted:
+                result = parse_string(value, pattern)
+                if result is not None:
+                    return result
+
+    for pattern in patterns:
+        result = try_pattern(value, pattern)
+        if result is not None:
+            return result
+        # error is expected - try next pattern
+
     raise ValueError(f"unable to parse {value=!r}")
 
 
+@functools.cache
+def _zone(name: str) -> zoneinfo.ZoneInfo:
+    """Return a shared ZoneInfo instance for a timezone name."""
+    return zoneinfo.ZoneInfo(name)
+
+
 def now(timezone: str | dt.tzinfo | None = None) -> dt.datetime:
     """Return a timezone-aware datetime for the specified or local timezone."""
     if timezone is None:
@@ -121,7 +292,7 @@ def now(timezone: str | dt.tzinfo | None = None) -> dt.datetime:
         raise TypeError(f"unsupported type {type(timezone).__name__!r}")
 
     try:
-        return dt.datetime.now(tz=zoneinfo.ZoneInfo(timezone))
+        return dt.datetime.now(tz=_zone(timezone))
     except zoneinfo.ZoneInfoNotFoundError as exc:
         choices = zoneinfo.available_timezones()
         if choices:
@@ -130,9 +301,15 @@ def now(timezone: str | dt.tzinfo | None = None) -> dt.datetime:
         raise LookupError("no timezone names available") from exc
 
 
-def timestamp(timezone: str | None = None, /, fmt: str | None = None) -> str:
+def timestamp(
+    timezone: str | dt.tzinfo | None = None, /, fmt: str | None = None
+) -> str:
     """Return a timestamp string with timezone info for the specified or local zone."""
-    current = now(timezone)
+    if isinstance(timezone, dt.tzinfo):
+        # fixed offsets and ZoneInfo instances need no name resolution
+        current = dt.datetime.now(tz=timezone)
+    else:
+        current = now(timezone)
     return current.isoformat() if fmt is None else current.strftime(fmt)
 
 
@@ -141,7 +318,7 @@ def isoformat(value: dt.date | dt.datetime) -> str:
     if isinstance(value, dt.date) and not isinstance(value, dt.datetime):
         return value.isoformat()
 
-    if (value.hour, value.minute, value.second, value.microsecond) == (0, 0, 0, 0):
+    if not (value.hour or value.minute or value.second or value.microsecond):
         return value.date().isoformat()
 
     return value.isoformat()
@@ -151,8 +328,12 @@ def last_day(value: DateTimeLike) -> dt.datetime:
     """Return the last day of the month which the given date belongs to."""
     value_dt = parse(value)
     tz = getattr(value_dt, "tzinfo", None)
-    _, day_count = calendar.monthrange(value_dt.year, value_dt.month)
-    return dt.datetime(value_dt.year, value_dt.month, day_count, tzinfo=tz)
+    year, month = value_dt.year, value_dt.month
+    if month == 2 and year % 4 == 0 and (year % 100 != 0 or year % 400 == 0):
+        day_count = 29
+    else:
+        day_count = _DAYS_IN_MONTH[month - 1]
+    return dt.datetime(year, month, day_count, tzinfo=tz)
 
 
 def offset(reference: DateTimeLike, value: int, unit: str) -> dt.datetime:
@@ -160,22 +341,15 @@ def offset(reference: DateTimeLike, value: int, unit: str) -> dt.datetime:
     if not isinstance(value, int):
         raise TypeError(f"unsupported type {type(value).__name__!r}; expected int")
 
-    valid_units = {
-        "weeks",
-        "days",
-        "hours",
-        "minutes",
-        "seconds",
-        "microseconds",
-        "milliseconds",
-    }
-    if unit not in valid_units:
-        message = f"invalid choice {unit!r}; expected a value from {valid_units!r}"
+    if unit not in _TIMEDELTA_UNITS:
+        message = f"invalid choice {unit!r}; expected a value from {_TIMEDELTA_UNITS!r}"
         raise ValueError(message)
 
     ref_dt = parse(reference)
+    if value == 0:
+        return ref_dt
 
-    return ref_dt + dt.timedelta(**{unit: value})
+    return ref_dt + _UNIT_CTORS[unit](value)
 
 
 def count(reference: DateTimeLike, value: int, unit: str) -> Iterator[dt.datetime]:
@@ -183,25 +357,16 @@ def count(reference: DateTimeLike, value: int, unit: str) -> Iterator[dt.datetim
     if not isinstance(value, int):
         raise TypeError(f"unsupported type {type(value).__name__!r}; expected int")
 
-    valid_units = {
-        "weeks",
-        "days",
-        "hours",
-        "minutes",
-        "seconds",
-        "microseconds",
-        "milliseconds",
-    }
-    if unit not in valid_units:
-        message = f"invalid choice {unit!r}; expected a value from {valid_units!r}"
+    if unit not in _TIMEDELTA_UNITS:
+        message = f"invalid choice {unit!r}; expected a value from {_TIMEDELTA_UNITS!r}"
         raise ValueError(message)
 
-    delta = dt.timedelta(**{unit: value})
-    current = parse(reference)
+    delta = _UNIT_CTORS[unit](value)
+    start_dt = parse(reference)
 
-    while True:
-        yield current
-        current = current + delta
+    # accumulate iterates at C level: each step is one timedelta addition
+    # without resuming a Python generator frame
+    return itertools.accumulate(itertools.repeat(delta), operator.add, initial=start_dt)
 
 
 def range(
@@ -1,23 +1,42 @@
+import functools
 import importlib
-import tomllib
+import re
+from collections.abc import Callable
 from pathlib import Path
 from types import ModuleType
 
 import pytest
 
+import timeteller as tt
+
 
 @pytest.fixture(scope="module")
 def project_pkg(project_name: str) -> ModuleType:
     return importlib.import_module(project_name)
 
 
-@pytest.fixture(scope="module")
+@pytest.fixture(scope="session")
 def project_name() -> str:
     project_root = Path(__file__).parent.parent.resolve()
     pyproject_toml = project_root / "pyproject.toml"
 
-    with open(pyproject_toml, mode="rb") as toml_file:
-        data = tomllib.load(toml_file)
-        name = data["project"]["name"]
+    # a targeted scan is enough for the name key; no need to parse the full TOML
+    text = pyproject_toml.read_text(encoding="utf-8")
+    match = re.search(r'(?m)^name\s*=\s*"([^"]+)"', text)
+    assert match is not None, f"no project name found in {pyproject_toml}"
+
+    return match.group(1)
+
+
+@pytest.fixture(scope="session")
+def make_duration() -> Callable[..., "tt.ext.Duration"]:
+    """Return a memoized Duration factory for hashable (string/datetime) inputs.
+
+    Safe to share across tests because Duration is frozen and immutable.
+    """
+
+    @functools.cache
+    def _make(start, end) -> "tt.ext.Duration":
+        return tt.ext.Duration(start, end)
 
-    return name
+    return _make
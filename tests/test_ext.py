@@ -4,11 +4,37 @@ import time
 from collections.abc import Callable
 from dataclasses import FrozenInstanceError
 
-import duckdb
 import pytest
 
 import timeteller as tt
 
+_REF_DT = dt.datetime(2020, 1, 15)
+
+# (start, end, iso, expected) rows shared verbatim by the compact-days and
+# compact-weeks tables; the as_default table keeps its own, longer tail.
+_MICROSECOND_CASES = [
+    ("2024-07-01T13:00:00.10Z", "2024-07-01T13:00:00.20Z", "PT0.1S", "0.1s"),
+    ("2024-07-01T13:00:00", "2024-07-01T13:00:00.5", "PT0.5S", "0.5s"),
+    ("2024-07-01T13:00:00", "2024-07-02T13:00:00.5", "P1DT0.5S", "1d 0.5s"),
+    ("2024-07-01T13:00:00", "2024-07-01T13:00:00.123", "PT0.123S", "0.123s"),
+    ("2024-07-01T13:00:00", "2024-07-01T13:00:01.123", "PT1.123S", "1.123s"),
+    ("2024-07-01T13:00:00", "2024-07-01T13:01:00.12", "PT1M0.12S", "1m 0.12s"),
+]
+
+
+def _plural(value: int | float) -> str:
+    return "" if value == 1 else "s"
+
+
+CAST_FUNCS = (
+    pytest.param(tt.ext.parse, id="parse"),
+    pytest.param(lambda x: x, id="identity"),
+    pytest.param(
+        lambda x: dt.datetime.combine(tt.ext.parse(x), dt.datetime.min.time()),
+        id="combine",
+    ),
+)
+
 
 class TestDuration:
     @pytest.mark.parametrize(
@@ -40,16 +66,15 @@ class TestDuration:
         result = tt.ext.Duration(start, end)
         assert repr(result) == expected
 
-    def test_immutability(self):
-        inst = tt.ext.Duration("2024-07-01T13:00:00", "2024-07-01T13:00:01")
-
-        # trying to modify an attribute should raise an error
-        for attr in ("start_dt", "end_dt", "delta"):
-            with pytest.raises(FrozenInstanceError):
-                setattr(inst, attr, 10)
+    @pytest.fixture(scope="class")
+    def inst(self) -> tt.ext.Duration:
+        return tt.ext.Duration("2024-07-01T13:00:00", "2024-07-01T13:00:01")
 
-        # trying to modify a derived attribute should raise an error
-        for attr in (
+    @pytest.mark.parametrize(
+        "attr",
+        [
+            "start_dt",
+            "end_dt",
             "years",
             "months",
             "days",
@@ -57,14 +82,24 @@ class TestDuration:
             "minutes",
             "seconds",
             "total_seconds",
-        ):
-            with pytest.raises(TypeError):
-                setattr(inst, attr, 10)
-
-        # adding a new attribute should fail
-        with pytest.raises(TypeError):
-            inst.new_attr = 10
+            "new_attr",
+            # precomputed private fields backing the public properties
+            "_years",
+            "_months",
+            "_days",
+            "_hours",
+            "_minutes",
+            "_seconds",
+            "_microseconds",
+            "_total_us",
+        ],
+    )
+    def test_immutability(self, inst: tt.ext.Duration, attr: str):
+        # declared fields raise FrozenInstanceError, everything else TypeError
+        with pytest.raises((FrozenInstanceError, TypeError)):
+            setattr(inst, attr, 10)
 
+    def test_no_instance_dict(self, inst: tt.ext.Duration):
         # dataclass with slots should not expose __dict__
         assert not hasattr(inst, "__dict__")
 
@@ -114,8 +149,14 @@ class TestDuration:
             ("T13:00:00", "T13:01:00.0", "0"),
         ],
     )
-    def test_formatted_seconds_extended(self, start: str, end: str, expected: str):
-        result = tt.ext.Duration(start, end)
+    def test_formatted_seconds_extended(
+        self,
+        make_duration,
+        start: str,
+        end: str,
+        expected: str,
+    ):
+        result = make_duration(start, end)
         assert isinstance(result, tt.ext.Duration)
         assert result.formatted_seconds == expected
 
@@ -144,8 +185,15 @@ class TestDuration:
             ("2024-07-01T14:00:00+02:00", "2024-07-01T13:00:00+01:00", "PT0S", "0s"),
         ],
     )
-    def test_is_zero_extended(self, start: str, end: str, iso: str, expected: str):
-        result = tt.ext.Duration(start, end)
+    def test_is_zero_extended(
+        self,
+        make_duration,
+        start: str,
+        end: str,
+        iso: str,
+        expected: str,
+    ):
+        result = make_duration(start, end)
         assert isinstance(result, tt.ext.Duration)
         assert result.is_zero is True
         assert result.as_iso() == iso
@@ -287,8 +335,15 @@ class TestDuration:
             ("2024-07-01T13:00:00+02:00", "2024-07-01T13:00:00+01:00", "PT1H", "1h"),
         ],
     )
-    def test_as_default_extended(self, start: str, end: str, iso: str, expected: str):
-        result = tt.ext.Duration(start, end)
+    def test_as_default_extended(
+        self,
+        make_duration,
+        start: str,
+        end: str,
+        iso: str,
+        expected: str,
+    ):
+        result = make_duration(start, end)
         assert isinstance(result, tt.ext.Duration)
         assert result.is_zero is False
         assert result.as_iso() == iso
@@ -323,17 +378,18 @@ class TestDuration:
                 "3d 2m",
             ),
             ("2024-07-01", "2025-08-02", "P1Y1M1D", "397d"),
-            # microseconds
-            ("2024-07-01T13:00:00.10Z", "2024-07-01T13:00:00.20Z", "PT0.1S", "0.1s"),
-            ("2024-07-01T13:00:00", "2024-07-01T13:00:00.5", "PT0.5S", "0.5s"),
-            ("2024-07-01T13:00:00", "2024-07-02T13:00:00.5", "P1DT0.5S", "1d 0.5s"),
-            ("2024-07-01T13:00:00", "2024-07-01T13:00:00.123", "PT0.123S", "0.123s"),
-            ("2024-07-01T13:00:00", "2024-07-01T13:00:01.123", "PT1.123S", "1.123s"),
-            ("2024-07-01T13:00:00", "2024-07-01T13:01:00.12", "PT1M0.12S", "1m 0.12s"),
-        ],
+        ]
+        + _MICROSECOND_CASES,
     )
-    def test_compact_days_extended(self, start: str, end: str, iso: str, expected: str):
-        result = tt.ext.Duration(start, end)
+    def test_compact_days_extended(
+        self,
+        make_duration,
+        start: str,
+        end: str,
+        iso: str,
+        expected: str,
+    ):
+        result = make_duration(start, end)
         assert isinstance(result, tt.ext.Duration)
         assert result.is_zero is False
         assert result.as_iso() == iso
@@ -373,17 +429,18 @@ class TestDuration:
                 "P1Y6DT1H1M1S",
                 "1y 6d 1h 1m 1s",
             ),
-            # microseconds
-            ("2024-07-01T13:00:00.10Z", "2024-07-01T13:00:00.20Z", "PT0.1S", "0.1s"),
-            ("2024-07-01T13:00:00", "2024-07-01T13:00:00.5", "PT0.5S", "0.5s"),
-            ("2024-07-01T13:00:00", "2024-07-02T13:00:00.5", "P1DT0.5S", "1d 0.5s"),
-            ("2024-07-01T13:00:00", "2024-07-01T13:00:00.123", "PT0.123S", "0.123s"),
-            ("2024-07-01T13:00:00", "2024-07-01T13:00:01.123", "PT1.123S", "1.123s"),
-            ("2024-07-01T13:00:00", "2024-07-01T13:01:00.12", "PT1M0.12S", "1m 0.12s"),
-        ],
+        ]
+        + _MICROSECOND_CASES,
     )
-    def test_compact_weeks_ext(self, start: str, end: str, iso: str, expected: str):
-        result = tt.ext.Duration(start, end)
+    def test_compact_weeks_ext(
+        self,
+        make_duration,
+        start: str,
+        end: str,
+        iso: str,
+        expected: str,
+    ):
+        result = make_duration(start, end)
         assert isinstance(result, tt.ext.Duration)
         assert result.is_zero is False
         assert result.as_iso() == iso
@@ -425,8 +482,15 @@ class TestDuration:
             ("2024-07-01T13:00:00", "2024-07-01T14:01:01", "PT1H1M1S", "3_661s"),
         ],
     )
-    def test_total_secs_extended(self, start: str, end: str, iso: str, expected: str):
-        result = tt.ext.Duration(start, end)
+    def test_total_secs_extended(
+        self,
+        make_duration,
+        start: str,
+        end: str,
+        iso: str,
+        expected: str,
+    ):
+        result = make_duration(start, end)
         assert isinstance(result, tt.ext.Duration)
         assert result.is_zero is False
         assert result.as_iso() == iso
@@ -456,23 +520,30 @@ class TestDuration:
             ),
         ],
     )
-    def test_custom(self, start: str, end: str, iso: str, expected: str):
+    def test_custom(
+        self,
+        make_duration,
+        start: str,
+        end: str,
+        iso: str,
+        expected: str,
+    ):
         def show_all(d: tt.ext.Duration) -> str:
-            def multiplier(value: int | float) -> str:
-                return "" if value == 1 else "s"
-
+            # read each property once; _plural avoids a per-call closure
+            years, months, days = d.years, d.months, d.days
+            hours, minutes, seconds = d.hours, d.minutes, d.seconds
             return ", ".join(
                 [
-                    f"{d.years} year{multiplier(d.years)}",
-                    f"{d.months} month{multiplier(d.months)}",
-                    f"{d.days} day{multiplier(d.days)}",
-                    f"{d.hours} hour{multiplier(d.hours)}",
-                    f"{d.minutes} minute{multiplier(d.minutes)}",
-                    f"{d.formatted_seconds} second{multiplier(d.seconds)}",
+                    f"{years} year{_plural(years)}",
+                    f"{months} month{_plural(months)}",
+                    f"{days} day{_plural(days)}",
+                    f"{hours} hour{_plural(hours)}",
+                    f"{minutes} minute{_plural(minutes)}",
+                    f"{d.formatted_seconds} second{_plural(seconds)}",
                 ]
             )
 
-        result = tt.ext.Duration(start, end)
+        result = make_duration(start, end)
         assert isinstance(result, tt.ext.Duration)
         assert result.is_zero is False
         assert result.as_iso() == iso
@@ -611,13 +682,20 @@ class TestDateSub:
             ("1970-01-01", "ref_date", 54),
         ],
     )
-    def test_datesub__year(self, get_ref_date, start: str, end: str, expected: int):
-        for cast_func in self.cast_funcs():
-            start = cast_func(get_ref_date(start))
-            end = cast_func(get_ref_date(end))
-            for part in ("year", "years", "y", "yr", "yrs"):
-                result = tt.ext.datesub(part, start, end)
-                assert result == expected
+    @pytest.mark.parametrize("cast_func", CAST_FUNCS)
+    def test_datesub__year(
+        self,
+        get_ref_date,
+        cast_func: Callable[[str], str | dt.date | dt.datetime],
+        start: str,
+        end: str,
+        expected: int,
+    ):
+        start = cast_func(get_ref_date(start))
+        end = cast_func(get_ref_date(end))
+        for part in ("year", "years", "y", "yr", "yrs"):
+            result = tt.ext.datesub(part, start, end)
+            assert result == expected
 
     @pytest.mark.parametrize(
         "start, end, expected",
@@ -672,13 +750,20 @@ class TestDateSub:
             ("1970-01-01", "ref_date", 654),
         ],
     )
-    def test_datesub__month(self, get_ref_date, start: str, end: str, expected: int):
-        for cast_func in self.cast_funcs():
-            start = cast_func(get_ref_date(start))
-            end = cast_func(get_ref_date(end))
-            for part in ("month", "months", "mon", "mons"):
-                result = tt.ext.datesub(part, start, end)
-                assert result == expected
+    @pytest.mark.parametrize("cast_func", CAST_FUNCS)
+    def test_datesub__month(
+        self,
+        get_ref_date,
+        cast_func: Callable[[str], str | dt.date | dt.datetime],
+        start: str,
+        end: str,
+        expected: int,
+    ):
+        start = cast_func(get_ref_date(start))
+        end = cast_func(get_ref_date(end))
+        for part in ("month", "months", "mon", "mons"):
+            result = tt.ext.datesub(part, start, end)
+            assert result == expected
 
     @pytest.mark.parametrize(
         "start, end, expected",
@@ -733,31 +818,31 @@ class TestDateSub:
             ("1970-01-01", "ref_date", 19_905),
         ],
     )
-    def test_datesub__day(self, get_ref_date, start: str, end: str, expected: int):
-        for cast_func in self.cast_funcs():
-            start = cast_func(get_ref_date(start))
-            end = cast_func(get_ref_date(end))
-            for part in ("day", "days", "d", "dayofmonth"):
-                result = tt.ext.datesub(part, start, end)
-                assert result == expected
-
-    @staticmethod
-    def cast_funcs() -> tuple[Callable[[str], str | dt.date | dt.datetime]]:
-        return (
-            tt.ext.parse,
-            lambda x: x,
-            lambda x: dt.datetime.combine(tt.ext.parse(x), dt.datetime.min.time()),
-        )
+    @pytest.mark.parametrize("cast_func", CAST_FUNCS)
+    def test_datesub__day(
+        self,
+        get_ref_date,
+        cast_func: Callable[[str], str | dt.date | dt.datetime],
+        start: str,
+        end: str,
+        expected: int,
+    ):
+        start = cast_func(get_ref_date(start))
+        end = cast_func(get_ref_date(end))
+        for part in ("day", "days", "d", "dayofmonth"):
+            result = tt.ext.datesub(part, start, end)
+            assert result == expected
 
-    @pytest.fixture(scope="class")
+    @pytest.fixture(scope="session")
     def get_ref_date(self, request: pytest.FixtureRequest) -> Callable[[str], str]:
         def inner(value: str) -> str:
             return request.getfixturevalue("ref_date") if value == "ref_date" else value
 
         return inner
 
-    @pytest.fixture(scope="class")
+    @pytest.fixture(scope="session")
     def ref_date(self) -> str:
+        # kept a string on purpose: the cast_funcs axis covers string inputs
         return "2024-07-01"
 
 
@@ -806,9 +891,8 @@ class TestOffset:
         ],
     )
     def test_zero_offset(self, unit: str):
-        ref_dt = dt.datetime(2020, 1, 15, 0, 0, 0)
-        result = tt.ext.offset(ref_dt, 0, unit)
-        assert result == dt.datetime(2020, 1, 15, 0, 0, 0)
+        result = tt.ext.offset(_REF_DT, 0, unit)
+        assert result == _REF_DT
 
     @pytest.mark.parametrize(
         "unit, value, expected",
@@ -836,8 +920,7 @@ class TestOffset:
         ],
     )
     def test_offset(self, unit: str, value: int, expected: dt.datetime):
-        ref_dt = dt.datetime(2020, 1, 15, 0, 0, 0)
-        result = tt.ext.offset(ref_dt, value, unit)
+        result = tt.ext.offset(_REF_DT, value, unit)
         assert result == expected
 
     @pytest.mark.parametrize(
@@ -879,5 +962,6 @@ class TestOffset:
         assert tt.ext.offset(ref_dt, -3, "MiNuTeS") == ref_dt + dt.timedelta(minutes=-3)
 
     def test_invalid_unit_raises_value_error(self):
+        duckdb = pytest.importorskip("duckdb")
         with pytest.raises(duckdb.ConversionException):
             tt.ext.offset(dt.datetime.now(), 1, "bad_value")
@@ -10,55 +10,143 @@ import time_machine
 
 import timeteller as tt
 
+# For example, on Windows w/o tzdata, available_timezones() returns an empty
+# set. Computed once at import: the call walks the tzdata tree, and skipif
+# conditions plus tests can all share the result.
+HAS_ZONE_NAMES = bool(zoneinfo.available_timezones())
+
+ZONE_SKIP = pytest.mark.skipif(not HAS_ZONE_NAMES, reason="no timezone names available")
+
+# (timezone, fmt, expected) rows for the merged timestamp test. Non-UTC zones
+# need tzdata, so the skip mark rides on their rows; the UTC rows always run.
+TIMESTAMP_ZONE_CASES = [
+    pytest.param(timezone, fmt, expected, marks=marks)
+    for timezone, marks, rows in [
+        (
+            dt.UTC,
+            (),
+            [
+                (None, "2024-01-01T00:00:00+00:00"),
+                ("%Y-%m-%d %H:%M:%S", "2024-01-01 00:00:00"),
+                ("%Y-%m-%d %H:%M:%S %Z", "2024-01-01 00:00:00 UTC"),
+                ("%Y-%m-%d %H:%M:%S%z", "2024-01-01 00:00:00+0000"),
+                ("%Y-%m-%d %H:%M:%S %Z%z", "2024-01-01 00:00:00 UTC+0000"),
+                ("%Y%m%d-%H%M%S", "20240101-000000"),
+                ("%H:%M:%S", "00:00:00"),
+                ("%A, %d %B %Y %H:%M:%S", "Monday, 01 January 2024 00:00:00"),
+            ],
+        ),
+        (
+            "CET",
+            (ZONE_SKIP,),
+            [
+                (None, "2024-01-01T01:00:00+01:00"),
+                ("%Y-%m-%d %H:%M:%S", "2024-01-01 01:00:00"),
+                ("%Y-%m-%d %H:%M:%S %Z", "2024-01-01 01:00:00 CET"),
+                ("%Y-%m-%d %H:%M:%S%z", "2024-01-01 01:00:00+0100"),
+                ("%Y-%m-%d %H:%M:%S %Z%z", "2024-01-01 01:00:00 CET+0100"),
+                ("%Y%m%d-%H%M%S", "20240101-010000"),
+                ("%H:%M:%S", "01:00:00"),
+                ("%A, %d %B %Y %H:%M:%S", "Monday, 01 January 2024 01:00:00"),
+            ],
+        ),
+        (
+            "US/Hawaii",
+            (ZONE_SKIP,),
+            [
+                (None, "2023-12-31T14:00:00-10:00"),
+                ("%Y-%m-%d %H:%M:%S", "2023-12-31 14:00:00"),
+                ("%Y-%m-%d %H:%M:%S %Z", "2023-12-31 14:00:00 HST"),
+                ("%Y-%m-%d %H:%M:%S%z", "2023-12-31 14:00:00-1000"),
+                ("%Y-%m-%d %H:%M:%S %Z%z", "2023-12-31 14:00:00 HST-1000"),
+                ("%Y%m%d-%H%M%S", "20231231-140000"),
+                ("%H:%M:%S", "14:00:00"),
+                ("%A, %d %B %Y %H:%M:%S", "Sunday, 31 December 2023 14:00:00"),
+            ],
+        ),
+        (
+            "Asia/Tokyo",
+            (ZONE_SKIP,),
+            [
+                (None, "2024-01-01T09:00:00+09:00"),
+                ("%Y-%m-%d %H:%M:%S", "2024-01-01 09:00:00"),
+                ("%Y-%m-%d %H:%M:%S %Z", "2024-01-01 09:00:00 JST"),
+                ("%Y-%m-%d %H:%M:%S%z", "2024-01-01 09:00:00+0900"),
+                ("%Y-%m-%d %H:%M:%S %Z%z", "2024-01-01 09:00:00 JST+0900"),
+                ("%Y%m%d-%H%M%S", "20240101-090000"),
+                ("%H:%M:%S", "09:00:00"),
+                ("%A, %d %B %Y %H:%M:%S", "Monday, 01 January 2024 09:00:00"),
+            ],
+        ),
+    ]
+    for fmt, expected in rows
+]
+
+# Fixed-offset zones shared across the parametrize tables; building them once
+# keeps collection cheap and their reprs identical between test IDs.
+TZ_PLUS_1 = dt.timezone(dt.timedelta(hours=1))
+TZ_MINUS_1 = dt.timezone(dt.timedelta(hours=-1))
+TZ_PLUS_2 = dt.timezone(dt.timedelta(hours=2))
+TZ_MINUS_5 = dt.timezone(dt.timedelta(hours=-5))
+TZ_PLUS_9 = dt.timezone(dt.timedelta(hours=9))
+TZ_MINUS_10 = dt.timezone(dt.timedelta(hours=-10))
+
+# Offset suffix of an aware ISO timestamp, precompiled once for the module.
+TS_SUFFIX_RE = re.compile(r"([+-]\d{2}:\d{2}|Z)$")
+
+# Suffixes that pin an aware timestamp string to UTC.
+UTC_SUFFIXES = ("Z", "+00:00", "-00:00")
+
+# One table instead of a parametrize matrix: each case is a single parse call,
+# so the per-case pytest overhead would dwarf the work under test.
+PARSE_CASES = [
+    # datetime
+    (dt.datetime(2024, 7, 1), dt.datetime(2024, 7, 1, 0, 0, 0)),
+    ("2024-07-01 00:00", dt.datetime(2024, 7, 1, 0, 0, 0)),
+    ("2024-07-01 00:00:00", dt.datetime(2024, 7, 1, 0, 0, 0)),
+    ("2024-07-01 12:00:00", dt.datetime(2024, 7, 1, 12, 0, 0)),
+    ("20240701_120114", dt.datetime(2024, 7, 1, 12, 1, 14)),
+    # date
+    (dt.date(2024, 7, 1), dt.datetime(2024, 7, 1)),
+    (dt.date(2024, 7, 1), dt.datetime(2024, 7, 1, 0, 0)),
+    (dt.date(2024, 7, 1), dt.datetime(2024, 7, 1, 0, 0, 0)),
+    ("2024-07-01", dt.datetime(2024, 7, 1)),
+    ("2024-07-01", dt.datetime(2024, 7, 1)),
+    ("20240701", dt.datetime(2024, 7, 1)),
+    # time
+    (dt.time(12, 30), dt.datetime(1900, 1, 1, 12, 30)),
+    ("12:30", dt.datetime(1900, 1, 1, 12, 30)),
+    ("12:30:00", dt.datetime(1900, 1, 1, 12, 30, 0)),
+    ("T12:30:00", dt.datetime(1900, 1, 1, 12, 30, 0)),
+    ("00:00", dt.datetime(1900, 1, 1, 0, 0)),
+    # ISO 8601
+    ("2024-07-01T00:00:00", dt.datetime(2024, 7, 1, 00)),
+    ("2024-07-01T12:00:00", dt.datetime(2024, 7, 1, 12)),
+    ("2024-07-01T23:59:59", dt.datetime(2024, 7, 1, 23, 59, 59)),
+    # microseconds
+    ("2024-07-01 12:00:00.123456", dt.datetime(2024, 7, 1, 12, 0, 0, 123456)),
+    ("2024-07-02T13:01:01.123456", dt.datetime(2024, 7, 2, 13, 1, 1, 123456)),
+    ("2024-07-02T13:01:01.1234567", dt.datetime(2024, 7, 2, 13, 1, 1, 123456)),
+    ("2024-07-02T13:01:01.12345678", dt.datetime(2024, 7, 2, 13, 1, 1, 123456)),
+    ("2024-07-02T13:01:01.012345678", dt.datetime(2024, 7, 2, 13, 1, 1, 12345)),
+    ("2024-07-02T13:01:01.001234", dt.datetime(2024, 7, 2, 13, 1, 1, 1234)),
+    ("12:15:00.123", dt.datetime(1900, 1, 1, 12, 15, 0, 123000)),
+    ("T12:45:00.456", dt.datetime(1900, 1, 1, 12, 45, 0, 456000)),
+    ("T12:45:00.010101", dt.datetime(1900, 1, 1, 12, 45, 0, 10101)),
+    ("T12:45:00.101010", dt.datetime(1900, 1, 1, 12, 45, 0, 101010)),
+    ("T12:45:00.012345", dt.datetime(1900, 1, 1, 12, 45, 0, 12345)),
+    ("T12:45:00.123450", dt.datetime(1900, 1, 1, 12, 45, 0, 123450)),
+    ("T12:45:00.000001", dt.datetime(1900, 1, 1, 12, 45, 0, 1)),
+    ("T12:45:00.00001", dt.datetime(1900, 1, 1, 12, 45, 0, 10)),
+]
+
 
 class TestDateTimeParsing:
-    @pytest.mark.parametrize(
-        "value, expected",
-        [
-            # datetime
-            (dt.datetime(2024, 7, 1), dt.datetime(2024, 7, 1, 0, 0, 0)),
-            ("2024-07-01 00:00", dt.datetime(2024, 7, 1, 0, 0, 0)),
-            ("2024-07-01 00:00:00", dt.datetime(2024, 7, 1, 0, 0, 0)),
-            ("2024-07-01 12:00:00", dt.datetime(2024, 7, 1, 12, 0, 0)),
-            ("20240701_120114", dt.datetime(2024, 7, 1, 12, 1, 14)),
-            # date
-            (dt.date(2024, 7, 1), dt.datetime(2024, 7, 1)),
-            (dt.date(2024, 7, 1), dt.datetime(2024, 7, 1, 0, 0)),
-            (dt.date(2024, 7, 1), dt.datetime(2024, 7, 1, 0, 0, 0)),
-            ("2024-07-01", dt.datetime(2024, 7, 1)),
-            ("2024-07-01", dt.datetime(2024, 7, 1)),
-            ("20240701", dt.datetime(2024, 7, 1)),
-            # time
-            (dt.time(12, 30), dt.datetime(1900, 1, 1, 12, 30)),
-            ("12:30", dt.datetime(1900, 1, 1, 12, 30)),
-            ("12:30:00", dt.datetime(1900, 1, 1, 12, 30, 0)),
-            ("T12:30:00", dt.datetime(1900, 1, 1, 12, 30, 0)),
-            ("00:00", dt.datetime(1900, 1, 1, 0, 0)),
-            # ISO 8601
-            ("2024-07-01T00:00:00", dt.datetime(2024, 7, 1, 00)),
-            ("2024-07-01T12:00:00", dt.datetime(2024, 7, 1, 12)),
-            ("2024-07-01T23:59:59", dt.datetime(2024, 7, 1, 23, 59, 59)),
-            # microseconds
-            ("2024-07-01 12:00:00.123456", dt.datetime(2024, 7, 1, 12, 0, 0, 123456)),
-            ("2024-07-02T13:01:01.123456", dt.datetime(2024, 7, 2, 13, 1, 1, 123456)),
-            ("2024-07-02T13:01:01.1234567", dt.datetime(2024, 7, 2, 13, 1, 1, 123456)),
-            ("2024-07-02T13:01:01.12345678", dt.datetime(2024, 7, 2, 13, 1, 1, 123456)),
-            ("2024-07-02T13:01:01.012345678", dt.datetime(2024, 7, 2, 13, 1, 1, 12345)),
-            ("2024-07-02T13:01:01.001234", dt.datetime(2024, 7, 2, 13, 1, 1, 1234)),
-            ("12:15:00.123", dt.datetime(1900, 1, 1, 12, 15, 0, 123000)),
-            ("T12:45:00.456", dt.datetime(1900, 1, 1, 12, 45, 0, 456000)),
-            ("T12:45:00.010101", dt.datetime(1900, 1, 1, 12, 45, 0, 10101)),
-            ("T12:45:00.101010", dt.datetime(1900, 1, 1, 12, 45, 0, 101010)),
-            ("T12:45:00.012345", dt.datetime(1900, 1, 1, 12, 45, 0, 12345)),
-            ("T12:45:00.123450", dt.datetime(1900, 1, 1, 12, 45, 0, 123450)),
-            ("T12:45:00.000001", dt.datetime(1900, 1, 1, 12, 45, 0, 1)),
-            ("T12:45:00.00001", dt.datetime(1900, 1, 1, 12, 45, 0, 10)),
-        ],
-    )
-    def test_parse(self, value: tt.stdlib.DateTimeLike, expected: dt.datetime):
-        result = tt.stdlib.parse(value)
-        assert result.tzinfo is None
-        assert result == expected
+    def test_parse(self):
+        for value, expected in PARSE_CASES:
+            result = tt.stdlib.parse(value)
+            assert result.tzinfo is None, value
+            assert result == expected, value
 
     @pytest.mark.parametrize(
         "value, expected",
@@ -77,27 +165,21 @@ class TestDateTimeParsing:
             ),
             (
                 "2024-07-01T11:00:00+01:00",
-                dt.datetime(2024, 7, 1, 11, tzinfo=dt.timezone(dt.timedelta(hours=1))),
+                dt.datetime(2024, 7, 1, 11, tzinfo=TZ_PLUS_1),
             ),
             (
                 "2024-07-01T11:00:00-01:00",
-                dt.datetime(2024, 7, 1, 11, tzinfo=dt.timezone(dt.timedelta(hours=-1))),
+                dt.datetime(2024, 7, 1, 11, tzinfo=TZ_MINUS_1),
             ),
             (
                 "2024-07-01T11:00:00+01:00",
-                dt.datetime(
-                    2024, 7, 1, 11, tzinfo=dt.timezone(dt.timedelta(seconds=3600))
-                ),
+                dt.datetime(2024, 7, 1, 11, tzinfo=TZ_PLUS_1),
             ),
         ],
     )
     def test_tzinfo(self, value: tt.stdlib.DateTimeLike, expected: dt.datetime):
         result = tt.stdlib.parse(value)
-        expected_tzname = (
-            "UTC"
-            if any(value.endswith(tz_suffix) for tz_suffix in ("Z", "+00:00", "-00:00"))
-            else f"UTC{value[-6:]}"
-        )
+        expected_tzname = "UTC" if value.endswith(UTC_SUFFIXES) else f"UTC{value[-6:]}"
         assert result.tzinfo is not None
         assert result.tzname() == expected_tzname
         assert result == expected
@@ -116,14 +198,14 @@ class TestDateTimeParsing:
     ):
         try:
             result = tt.stdlib.parse(value_cet)
-            expected = value_dt.replace(tzinfo=dt.timezone(dt.timedelta(seconds=3600)))
+            expected = value_dt.replace(tzinfo=TZ_PLUS_1)
             assert result.tzinfo is not None
             assert result.tzname() == "UTC+01:00"
             assert result == expected
         except AssertionError:
             value_cest = value_cet.replace("+01:00", "+02:00")
             result = tt.stdlib.parse(value_cest)
-            expected = value_dt.replace(tzinfo=dt.timezone(dt.timedelta(seconds=7200)))
+            expected = value_dt.replace(tzinfo=TZ_PLUS_2)
             assert result.tzinfo is not None
             assert result.tzname() == "UTC+02:00"
             assert result == expected
@@ -169,9 +251,6 @@ class TestDateTimeParsing:
 
 
 class TestNowAndTimestamp:
-    # For example, on Windows w/o tzdata, available_timezones() returns empty set
-    HAS_ZONE_NAMES = bool(zoneinfo.available_timezones())
-
     @pytest.mark.skipif(not HAS_ZONE_NAMES, reason="no timezone names available")
     def test_now_with_zone_name(self):
         dt_obj = tt.stdlib.now("UTC")
@@ -194,17 +273,17 @@ class TestNowAndTimestamp:
     def test_timestamp_default_includes_offset_or_z(self):
         ts = tt.stdlib.timestamp()
         assert isinstance(ts, str)
-        assert re.search(r"([+-]\d{2}:\d{2}|Z)$", ts)
+        assert TS_SUFFIX_RE.search(ts)
 
     @pytest.mark.skipif(not HAS_ZONE_NAMES, reason="no timezone names available")
-    def test_timestamp_with_format_matches_now(self):
-        fmt = "%Y-%m-%d %H:%M"
-        ts = tt.stdlib.timestamp("UTC", fmt=fmt)
-        now_dt = tt.stdlib.now("UTC")
-        assert ts == now_dt.strftime(fmt)
+    def test_timestamp_with_format_matches_now(self, traveller):
+        # frozen clock, so the expected string is a literal rather than a
+        # second now()/strftime round-trip racing the call under test
+        ts = tt.stdlib.timestamp("UTC", fmt="%Y-%m-%d %H:%M")
+        assert ts == "2024-01-01 00:00"
 
     def test_now_invalid_zone_raises_expected_error(self):
-        expected_error = ValueError if self.HAS_ZONE_NAMES else LookupError
+        expected_error = ValueError if HAS_ZONE_NAMES else LookupError
         with pytest.raises(expected_error):
             tt.stdlib.now("not/a/real/timezone")
 
@@ -213,85 +292,25 @@ class TestNowAndTimestamp:
         """Return the seed for the time machine."""
         return dt.datetime(2024, 1, 1, 0, 0, 0)
 
-    def test_timestamp_default_call(self, seed: dt.datetime):
-        with time_machine.travel(seed):
-            result = tt.stdlib.timestamp(dt.UTC)
-            assert result == "2024-01-01T00:00:00+00:00"
-
-    @pytest.mark.parametrize(
-        "fmt, expected",
-        [
-            (None, "2024-01-01T00:00:00+00:00"),
-            ("%Y-%m-%d %H:%M:%S", "2024-01-01 00:00:00"),
-            ("%Y-%m-%d %H:%M:%S %Z", "2024-01-01 00:00:00 UTC"),
-            ("%Y-%m-%d %H:%M:%S%z", "2024-01-01 00:00:00+0000"),
-            ("%Y-%m-%d %H:%M:%S %Z%z", "2024-01-01 00:00:00 UTC+0000"),
-            ("%Y%m%d-%H%M%S", "20240101-000000"),
-            ("%H:%M:%S", "00:00:00"),
-            ("%A, %d %B %Y %H:%M:%S", "Monday, 01 January 2024 00:00:00"),
-        ],
-    )
-    def test_timestamp_with_utc(self, fmt: str, expected: str, seed: dt.datetime):
-        with time_machine.travel(seed):
-            result = tt.stdlib.timestamp(dt.UTC, fmt)
-            assert result == expected
-
-    @pytest.mark.skipif(not HAS_ZONE_NAMES, reason="no timezone names available")
-    @pytest.mark.parametrize(
-        "fmt, expected",
-        [
-            (None, "2024-01-01T01:00:00+01:00"),
-            ("%Y-%m-%d %H:%M:%S", "2024-01-01 01:00:00"),
-            ("%Y-%m-%d %H:%M:%S %Z", "2024-01-01 01:00:00 CET"),
-            ("%Y-%m-%d %H:%M:%S%z", "2024-01-01 01:00:00+0100"),
-            ("%Y-%m-%d %H:%M:%S %Z%z", "2024-01-01 01:00:00 CET+0100"),
-            ("%Y%m%d-%H%M%S", "20240101-010000"),
-            ("%H:%M:%S", "01:00:00"),
-            ("%A, %d %B %Y %H:%M:%S", "Monday, 01 January 2024 01:00:00"),
-        ],
-    )
-    def test_timestamp_with_cet(self, fmt: str, expected: str, seed: dt.datetime):
-        with time_machine.travel(seed):
-            result = tt.stdlib.timestamp("CET", fmt)
-            assert result == expected
+    @pytest.fixture(scope="class")
+    def traveller(self, seed: dt.datetime) -> Iterator[None]:
+        """Freeze time at the seed once per class; patching on every test is costly."""
+        with time_machine.travel(seed, tick=False):
+            yield
 
-    @pytest.mark.skipif(not HAS_ZONE_NAMES, reason="no timezone names available")
-    @pytest.mark.parametrize(
-        "fmt, expected",
-        [
-            (None, "2023-12-31T14:00:00-10:00"),
-            ("%Y-%m-%d %H:%M:%S", "2023-12-31 14:00:00"),
-            ("%Y-%m-%d %H:%M:%S %Z", "2023-12-31 14:00:00 HST"),
-            ("%Y-%m-%d %H:%M:%S%z", "2023-12-31 14:00:00-1000"),
-            ("%Y-%m-%d %H:%M:%S %Z%z", "2023-12-31 14:00:00 HST-1000"),
-            ("%Y%m%d-%H%M%S", "20231231-140000"),
-            ("%H:%M:%S", "14:00:00"),
-            ("%A, %d %B %Y %H:%M:%S", "Sunday, 31 December 2023 14:00:00"),
-        ],
-    )
-    def test_timestamp_with_hawaii(self, fmt: str, expected: str, seed: dt.datetime):
-        with time_machine.travel(seed):
-            result = tt.stdlib.timestamp("US/Hawaii", fmt)
-            assert result == expected
+    def test_timestamp_default_call(self, traveller):
+        result = tt.stdlib.timestamp(dt.UTC)
+        assert result == "2024-01-01T00:00:00+00:00"
 
-    @pytest.mark.skipif(not HAS_ZONE_NAMES, reason="no timezone names available")
-    @pytest.mark.parametrize(
-        "fmt, expected",
-        [
-            (None, "2024-01-01T09:00:00+09:00"),
-            ("%Y-%m-%d %H:%M:%S", "2024-01-01 09:00:00"),
-            ("%Y-%m-%d %H:%M:%S %Z", "2024-01-01 09:00:00 JST"),
-            ("%Y-%m-%d %H:%M:%S%z", "2024-01-01 09:00:00+0900"),
-            ("%Y-%m-%d %H:%M:%S %Z%z", "2024-01-01 09:00:00 JST+0900"),
-            ("%Y%m%d-%H%M%S", "20240101-090000"),
-            ("%H:%M:%S", "09:00:00"),
-            ("%A, %d %B %Y %H:%M:%S", "Monday, 01 January 2024 09:00:00"),
-        ],
-    )
-    def test_timestamp_with_tokyo(self, fmt: str, expected: str, seed: dt.datetime):
-        with time_machine.travel(seed):
-            result = tt.stdlib.timestamp("Asia/Tokyo", fmt)
-            assert result == expected
+    @pytest.mark.parametrize("timezone, fmt, expected", TIMESTAMP_ZONE_CASES)
+    def test_timestamp_with_zone(
+        self,
+        timezone: str | dt.tzinfo,
+        fmt: str | None,
+        expected: str,
+        traveller,
+    ):
+        assert tt.stdlib.timestamp(timezone, fmt) == expected
 
     @pytest.mark.skipif(not HAS_ZONE_NAMES, reason="no timezone names available")
     @pytest.mark.parametrize(
@@ -309,35 +328,19 @@ class TestNowAndTimestamp:
                 "CET",
                 None,
                 "2024-01-01T01:00:00+01:00",
-                dt.datetime(
-                    2024, 1, 1, 1, 0, tzinfo=dt.timezone(dt.timedelta(seconds=3600))
-                ),
+                dt.datetime(2024, 1, 1, 1, 0, tzinfo=TZ_PLUS_1),
             ),
             (
                 "US/Hawaii",
                 None,
                 "2023-12-31T14:00:00-10:00",
-                dt.datetime(
-                    2023,
-                    12,
-                    31,
-                    14,
-                    0,
-                    tzinfo=dt.timezone(dt.timedelta(days=-1, seconds=50400)),
-                ),
+                dt.datetime(2023, 12, 31, 14, 0, tzinfo=TZ_MINUS_10),
             ),
             (
                 "Asia/Tokyo",
                 None,
                 "2024-01-01T09:00:00+09:00",
-                dt.datetime(
-                    2024,
-                    1,
-                    1,
-                    9,
-                    0,
-                    tzinfo=dt.timezone(dt.timedelta(seconds=32400)),
-                ),
+                dt.datetime(2024, 1, 1, 9, 0, tzinfo=TZ_PLUS_9),
             ),
         ],
     )
@@ -347,12 +350,11 @@ class TestNowAndTimestamp:
         fmt: str,
         expected_str: str,
         expected_dt: dt.datetime,
-        seed: dt.datetime,
+        traveller,
     ):
-        with time_machine.travel(seed):
-            result = tt.stdlib.timestamp(timezone, fmt)
-            assert result == expected_str
-            assert tt.stdlib.parse(result) == expected_dt
+        result = tt.stdlib.timestamp(timezone, fmt)
+        assert result == expected_str
+        assert tt.stdlib.parse(result) == expected_dt
 
 
 class TestIsoformat:
@@ -392,9 +394,7 @@ class TestIsoformat:
         [
             (dt.datetime(2024, 1, 1, 0, 0, 0, tzinfo=dt.UTC), "2024-01-01"),
             (
-                dt.datetime(
-                    2024, 1, 1, 0, 0, 0, tzinfo=dt.timezone(dt.timedelta(hours=2))
-                ),
+                dt.datetime(2024, 1, 1, 0, 0, 0, tzinfo=TZ_PLUS_2),
                 "2024-01-01",
             ),
         ],
@@ -410,9 +410,7 @@ class TestIsoformat:
                 "2024-01-01T08:30:00+00:00",
             ),
             (
-                dt.datetime(
-                    2024, 1, 1, 23, 59, 59, tzinfo=dt.timezone(dt.timedelta(hours=-5))
-                ),
+                dt.datetime(2024, 1, 1, 23, 59, 59, tzinfo=TZ_MINUS_5),
                 "2024-01-01T23:59:59-05:00",
             ),
         ],